@@ -2,16 +2,116 @@
 
 from __future__ import annotations
 
+import io
+
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
-from numerical import detect_outliers_zscore, trip_duration_stats, calculate_fares
+from numerical import trip_duration_stats
 from pricing import CasualPricing, MemberPricing
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # optional: fall back to DataFrame.to_csv
+    pa = None
+
 DATA_DIR = Path(__file__).resolve().parent / "data"
 OUTPUT_DIR = Path(__file__).resolve().parent / "output"
 
+# Column types pushed into read_csv for the id and label columns. Numeric and date
+# columns are left to clean_data, which coerces bad cells to NaN/NaT instead of failing.
+TRIP_DTYPES = {
+    "trip_id": "string",
+    "user_id": "string",
+    "user_type": "category",
+    "bike_id": "category",
+    "bike_type": "category",
+    "start_station_id": "string",
+    "end_station_id": "string",
+    "status": "category",
+}
+MAINTENANCE_DTYPES = {"bike_type": "category", "maintenance_type": "category"}
+
+# Calendar parts of start_time derived once per trips frame (in clean_data, or on first
+# use for frames that skipped it); not written to the clean CSV.
+DERIVED_TRIP_COLUMNS = ["_hour", "_dow", "_month"]
+DAY_NAMES = np.array(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"])
+
+
+def _all_equal(a, b) -> bool:
+    return pc.all(pc.equal(a, b)).as_py() is not False
+
+
+def _arrow_csv_table(df: pd.DataFrame) -> pa.Table | None:
+    """Return *df* as an Arrow table that pyarrow's writer renders exactly as to_csv does.
+
+    Returns None when a column type can't be rendered identically.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        col = table.column(i)
+        t = field.type
+        if pa.types.is_timestamp(t):
+            # pyarrow would drop the UTC offset or the fractional seconds
+            if t.tz is not None or not _all_equal(pc.floor_temporal(col, unit="second"), col):
+                return None
+            # Date-only columns print as dates, others to the second
+            is_date = _all_equal(pc.floor_temporal(col, unit="day"), col)
+            col = col.cast(pa.date32() if is_date else pa.timestamp("s"))
+        elif pa.types.is_floating(t) or pa.types.is_boolean(t):
+            # pyarrow formats these differently (2 vs 2.0, true vs True); use pandas' text
+            values = df.iloc[:, i]
+            col = pa.array(values.astype(str).to_numpy(object), mask=values.isna().to_numpy(), type=pa.string())
+        elif pa.types.is_dictionary(t):
+            if not (pa.types.is_string(t.value_type) or pa.types.is_large_string(t.value_type)):
+                return None
+        elif not (pa.types.is_integer(t) or pa.types.is_string(t) or pa.types.is_large_string(t)):
+            return None
+        table = table.set_column(i, field.name, col)
+    return table
+
+
+def _write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write *df* without its index, via pyarrow's multithreaded writer when installed.
+
+    Both paths produce the same text as ``DataFrame.to_csv``; frames the pyarrow path
+    cannot render identically go through ``to_csv``.
+    """
+    if pa is not None and df.shape[1] >= 2:  # csv quotes a blank one-field row as ""
+        try:
+            table = _arrow_csv_table(df)
+            if table is not None:
+                with open(path, "wb") as f:
+                    # pyarrow quotes every header and string field; take the header from
+                    # pandas and write the rows unquoted, which pyarrow refuses for values
+                    # needing quotes
+                    f.write(df.head(0).to_csv(index=False).encode("utf-8"))
+                    pacsv.write_csv(table, f, pacsv.WriteOptions(include_header=False, quoting_style="none"))
+                return
+        except pa.ArrowException:
+            pass
+    df.to_csv(path, index=False)
+
+
+def _add_start_parts(trips: pd.DataFrame) -> None:
+    """Add the DERIVED_TRIP_COLUMNS to *trips* in place."""
+    start = trips["start_time"].dt
+    trips["_hour"] = start.hour.astype("int8")
+    trips["_dow"] = start.dayofweek.astype("int8")
+    trips["_month"] = start.to_period("M")
+
+
+def _normalize_labels(s: pd.Series) -> pd.Series:
+    """Lower-case and strip a low-cardinality label column via its categories."""
+    cat = s.astype("category")
+    labels = cat.cat.categories.astype(str).str.strip().str.lower()
+    if labels.is_unique:
+        return cat.cat.rename_categories(labels)
+    return cat.map(dict(zip(cat.cat.categories, labels))).astype("category")
+
 
 class BikeShareSystem:
     """Central analysis class — loads, cleans, and analyzes bike-share data."""
@@ -22,9 +122,9 @@ class BikeShareSystem:
         self.maintenance: pd.DataFrame | None = None
 
     def load_data(self) -> None:
-        self.trips = pd.read_csv(DATA_DIR / "trips.csv")
+        self.trips = pd.read_csv(DATA_DIR / "trips.csv", dtype=TRIP_DTYPES)
         self.stations = pd.read_csv(DATA_DIR / "stations.csv")
-        self.maintenance = pd.read_csv(DATA_DIR / "maintenance.csv")
+        self.maintenance = pd.read_csv(DATA_DIR / "maintenance.csv", dtype=MAINTENANCE_DTYPES)
 
     def inspect_data(self) -> None:
         for name, df in [("Trips", self.trips), ("Stations", self.stations), ("Maintenance", self.maintenance)]:
@@ -38,12 +138,14 @@ class BikeShareSystem:
         if self.trips is None or self.stations is None or self.maintenance is None:
             raise RuntimeError("Call load_data() first")
 
-        trips = self.trips.copy()
-        stations = self.stations.copy()
-        maint = self.maintenance.copy()
+        trips = self.trips
+        stations = self.stations
+        maint = self.maintenance
 
         # --- Trips ---
-        trips = trips.drop_duplicates(subset=["trip_id"])
+        # One copy per frame, taken after deduplication; it detaches the result from
+        # the loaded frame so pandas < 3 doesn't warn on the column assignments below
+        trips = trips.drop_duplicates(subset=["trip_id"]).copy()
 
         trips["start_time"] = pd.to_datetime(trips["start_time"], errors="coerce")
         trips["end_time"] = pd.to_datetime(trips["end_time"], errors="coerce")
@@ -51,32 +153,41 @@ class BikeShareSystem:
         trips["duration_minutes"] = pd.to_numeric(trips["duration_minutes"], errors="coerce")
         trips["distance_km"] = pd.to_numeric(trips["distance_km"], errors="coerce")
 
-        trips["user_type"] = trips["user_type"].astype(str).str.lower().str.strip()
-        trips["bike_type"] = trips["bike_type"].astype(str).str.lower().str.strip()
-        trips["status"] = trips["status"].astype(str).str.lower().str.strip()
-
-        trips.loc[trips["status"].isin(["nan", "none", ""]), "status"] = np.nan
-        mode_status = trips["status"].mode(dropna=True)
-        fill_status = mode_status.iloc[0] if len(mode_status) else "completed"
-        trips["status"] = trips["status"].fillna(fill_status)
-
-        trips["duration_minutes"] = trips["duration_minutes"].fillna(trips["duration_minutes"].median())
-        trips["distance_km"] = trips["distance_km"].fillna(trips["distance_km"].median())
-
-        trips = trips.dropna(subset=["start_time", "end_time"])
-        trips = trips[trips["end_time"] >= trips["start_time"]]
-        trips = trips[trips["duration_minutes"] >= 0]
-        trips = trips[trips["distance_km"] >= 0]
-
-        trips = trips[trips["user_type"].isin(["casual", "member"])]
-        trips = trips[trips["bike_type"].isin(["classic", "electric"])]
-        trips = trips[trips["status"].isin(["completed", "cancelled"])]
+        for col in ["user_type", "bike_type", "status"]:
+            trips[col] = _normalize_labels(trips[col])
+
+        # Dropping the sentinel categories turns those rows into NaN without a row scan
+        status = trips["status"]
+        status = status.cat.remove_categories(status.cat.categories.intersection(["nan", "none", ""]))
+        counts = status.value_counts()
+        fill_status = counts.idxmax() if counts.sum() else "completed"
+        if fill_status not in status.cat.categories:
+            status = status.cat.add_categories([fill_status])
+        trips["status"] = status.fillna(fill_status)
+
+        numeric = ["duration_minutes", "distance_km"]
+        trips[numeric] = trips[numeric].fillna(trips[numeric].median())
+
+        # NaT compares False, so this also drops rows with missing timestamps
+        mask = (
+            (trips["end_time"] >= trips["start_time"])
+            & (trips["duration_minutes"] >= 0)
+            & (trips["distance_km"] >= 0)
+            & trips["user_type"].isin(["casual", "member"])
+            & trips["bike_type"].isin(["classic", "electric"])
+            & trips["status"].isin(["completed", "cancelled"])
+        )
+        trips = trips[mask]
+        for col in ["user_type", "bike_type", "status"]:
+            trips[col] = trips[col].cat.remove_unused_categories()
 
         trips["duration_minutes"] = (trips["end_time"] - trips["start_time"]).dt.total_seconds() / 60.0
         trips["duration_minutes"] = trips["duration_minutes"].clip(lower=0)
 
+        _add_start_parts(trips)
+
         # --- Stations ---
-        stations = stations.drop_duplicates(subset=["station_id"])
+        stations = stations.drop_duplicates(subset=["station_id"]).copy()
         stations["capacity"] = pd.to_numeric(stations["capacity"], errors="coerce").astype("Int64")
         stations["latitude"] = pd.to_numeric(stations["latitude"], errors="coerce")
         stations["longitude"] = pd.to_numeric(stations["longitude"], errors="coerce")
@@ -85,24 +196,26 @@ class BikeShareSystem:
         stations = stations[(stations["latitude"].between(-90, 90)) & (stations["longitude"].between(-180, 180))]
 
         # --- Maintenance ---
-        maint = maint.drop_duplicates(subset=["record_id"])
+        maint = maint.drop_duplicates(subset=["record_id"]).copy()
         maint["date"] = pd.to_datetime(maint["date"], errors="coerce")
         maint["cost"] = pd.to_numeric(maint["cost"], errors="coerce")
-        maint["bike_type"] = maint["bike_type"].astype(str).str.lower().str.strip()
-        maint["maintenance_type"] = maint["maintenance_type"].astype(str).str.lower().str.strip()
+        maint["bike_type"] = _normalize_labels(maint["bike_type"])
+        maint["maintenance_type"] = _normalize_labels(maint["maintenance_type"])
         maint = maint.dropna(subset=["record_id", "bike_id", "bike_type", "date", "maintenance_type"])
         maint = maint[maint["bike_type"].isin(["classic", "electric"])]
+        maint["bike_type"] = maint["bike_type"].cat.remove_unused_categories()
 
         overall_med = maint["cost"].median()
-        maint["cost"] = maint.groupby("bike_type")["cost"].transform(lambda s: s.fillna(s.median()))
+        medians = maint.groupby("bike_type", observed=True)["cost"].median()
+        maint["cost"] = maint["cost"].fillna(maint["bike_type"].map(medians).astype("float64"))
         maint["cost"] = maint["cost"].fillna(overall_med)
 
         self.trips, self.stations, self.maintenance = trips, stations, maint
 
         DATA_DIR.mkdir(parents=True, exist_ok=True)
-        trips.to_csv(DATA_DIR / "trips_clean.csv", index=False)
-        stations.to_csv(DATA_DIR / "stations_clean.csv", index=False)
-        maint.to_csv(DATA_DIR / "maintenance_clean.csv", index=False)
+        _write_csv(trips.drop(columns=DERIVED_TRIP_COLUMNS), DATA_DIR / "trips_clean.csv")
+        _write_csv(stations, DATA_DIR / "stations_clean.csv")
+        _write_csv(maint, DATA_DIR / "maintenance_clean.csv")
 
     # --------------------- Analytics (Q1–Q14) ---------------------
 
@@ -110,33 +223,35 @@ class BikeShareSystem:
         df = self._trips()
         return {
             "total_trips": int(len(df)),
-            "total_distance_km": float(round(df["distance_km"].sum(), 2)),
-            "avg_duration_min": float(round(df["duration_minutes"].mean(), 2)),
+            "total_distance_km": round(float(df["distance_km"].sum()), 2),
+            "avg_duration_min": round(float(df["duration_minutes"].mean()), 2),
         }
 
     def top_start_stations(self, n: int = 10) -> pd.DataFrame:
         df = self._trips()
-        st = self._stations()
         counts = df["start_station_id"].value_counts().head(n).rename_axis("station_id").reset_index(name="trip_count")
-        return counts.merge(st[["station_id", "station_name"]], on="station_id", how="left")
+        counts["station_name"] = counts["station_id"].map(self._station_names())
+        return counts
 
     def top_end_stations(self, n: int = 10) -> pd.DataFrame:
         df = self._trips()
-        st = self._stations()
         counts = df["end_station_id"].value_counts().head(n).rename_axis("station_id").reset_index(name="trip_count")
-        return counts.merge(st[["station_id", "station_name"]], on="station_id", how="left")
+        counts["station_name"] = counts["station_id"].map(self._station_names())
+        return counts
 
     def peak_usage_hours(self) -> pd.Series:
-        df = self._trips()
-        return df["start_time"].dt.hour.value_counts().sort_index()
+        df = self._trips_with_start_parts()
+        return df["_hour"].value_counts().sort_index().rename_axis("start_time")
 
     def busiest_day_of_week(self) -> pd.Series:
-        df = self._trips()
-        return df["start_time"].dt.day_name().value_counts()
+        df = self._trips_with_start_parts()
+        counts = df["_dow"].value_counts()
+        counts.index = pd.Index(DAY_NAMES[counts.index.to_numpy()], name="start_time")
+        return counts
 
     def avg_distance_by_user_type(self) -> pd.Series:
         df = self._trips()
-        return df.groupby("user_type")["distance_km"].mean().round(3)
+        return df.groupby("user_type", observed=True)["distance_km"].mean().round(3)
 
     def bike_utilization_rate(self) -> float:
         df = self._trips()
@@ -148,38 +263,25 @@ class BikeShareSystem:
         return float(total_used_minutes / (num_bikes * window_minutes))
 
     def monthly_trip_trend(self) -> pd.Series:
-        df = self._trips()
-        return df.groupby(df["start_time"].dt.to_period("M"))["trip_id"].count().sort_index()
+        df = self._trips_with_start_parts()
+        return df.groupby("_month")["trip_id"].count().sort_index().rename_axis("start_time")
 
     def top_active_users(self, n: int = 15) -> pd.DataFrame:
         df = self._trips()
-        out = df.groupby(["user_id", "user_type"])["trip_id"].count().reset_index(name="trip_count")
+        out = df.groupby(["user_id", "user_type"], observed=True)["trip_id"].count().reset_index(name="trip_count")
         return out.sort_values("trip_count", ascending=False).head(n)
 
     def maintenance_cost_by_bike_type(self) -> pd.Series:
         m = self._maint()
-        return m.groupby("bike_type")["cost"].sum().round(2)
+        return m.groupby("bike_type", observed=True)["cost"].sum().round(2)
 
     def top_routes(self, n: int = 10) -> pd.DataFrame:
         df = self._trips()
-        st = self._stations()
+        names = self._station_names()
         routes = df.groupby(["start_station_id", "end_station_id"])["trip_id"].count().reset_index(name="trip_count")
         routes = routes.sort_values("trip_count", ascending=False).head(n)
-
-        routes = routes.merge(
-            st[["station_id", "station_name"]],
-            left_on="start_station_id",
-            right_on="station_id",
-            how="left",
-        ).drop(columns=["station_id"]).rename(columns={"station_name": "start_station_name"})
-
-        routes = routes.merge(
-            st[["station_id", "station_name"]],
-            left_on="end_station_id",
-            right_on="station_id",
-            how="left",
-        ).drop(columns=["station_id"]).rename(columns={"station_name": "end_station_name"})
-
+        routes["start_station_name"] = routes["start_station_id"].map(names)
+        routes["end_station_name"] = routes["end_station_id"].map(names)
         return routes
 
     def trip_completion_rate(self) -> pd.Series:
@@ -189,28 +291,30 @@ class BikeShareSystem:
 
     def avg_trips_per_user_by_type(self) -> pd.Series:
         df = self._trips()
-        user_counts = df.groupby(["user_type", "user_id"])["trip_id"].count()
-        return user_counts.groupby("user_type").mean().round(3)
+        user_counts = df.groupby(["user_type", "user_id"], observed=True)["trip_id"].count()
+        return user_counts.groupby("user_type", observed=True).mean().round(3)
 
     def bikes_highest_maintenance_frequency(self, n: int = 10) -> pd.DataFrame:
         m = self._maint()
-        freq = m.groupby(["bike_id", "bike_type"])["record_id"].count().reset_index(name="maintenance_count")
+        freq = m.groupby(["bike_id", "bike_type"], observed=True)["record_id"].count().reset_index(name="maintenance_count")
         return freq.sort_values("maintenance_count", ascending=False).head(n)
 
     def outlier_trips(self, threshold: float = 3.0) -> pd.DataFrame:
         df = self._trips()
-        mask_dur = detect_outliers_zscore(df["duration_minutes"].to_numpy(), threshold=threshold)
-        mask_dist = detect_outliers_zscore(df["distance_km"].to_numpy(), threshold=threshold)
-
-        any_mask = mask_dur | mask_dist
-        reasons = np.where(
-            mask_dur & mask_dist,
-            "duration+distance",
-            np.where(mask_dur, "duration", "distance"),
-        )
+        # z-scores for both columns in one pass over a (2, N) array
+        arr = np.stack([df["duration_minutes"].to_numpy(np.float64), df["distance_km"].to_numpy(np.float64)])
+        mu = arr.mean(axis=1, keepdims=True)
+        sd = arr.std(axis=1, keepdims=True)
+        sd[sd == 0.0] = np.inf  # constant column: no outliers
+        mask = np.abs(arr - mu) / sd >= float(threshold)
+        any_mask = mask.any(axis=0)
+
+        sub = mask[:, any_mask]
+        codes = sub[0].astype(np.int8) + 2 * sub[1].astype(np.int8)
+        reasons = np.array(["", "duration", "distance", "duration+distance"])[codes]
 
         out = df.loc[any_mask, ["trip_id", "duration_minutes", "distance_km", "user_type", "status"]].copy()
-        out["outlier_reason"] = reasons[any_mask]
+        out["outlier_reason"] = reasons
         return out.sort_values(["outlier_reason", "duration_minutes"], ascending=[True, False])
 
     def revenue_by_user_type(self) -> pd.Series:
@@ -218,97 +322,108 @@ class BikeShareSystem:
         casual = CasualPricing()
         member = MemberPricing()
 
-        rev = {}
-        for utype, strat in [("casual", casual), ("member", member)]:
-            sub = df[df["user_type"] == utype]
-            fares = calculate_fares(
-                durations=sub["duration_minutes"].to_numpy(),
-                distances=sub["distance_km"].to_numpy(),
-                per_minute=strat.PER_MINUTE,
-                per_km=strat.PER_KM,
-                unlock_fee=getattr(strat, "UNLOCK_FEE", 0.0),
-            )
-            rev[utype] = float(np.sum(fares))
+        # Per-row rates picked by user type, so all fares come from one array pass
+        is_casual = (df["user_type"] == "casual").to_numpy()
+        per_minute = np.where(is_casual, casual.PER_MINUTE, member.PER_MINUTE)
+        per_km = np.where(is_casual, casual.PER_KM, member.PER_KM)
+        unlock = np.where(is_casual, getattr(casual, "UNLOCK_FEE", 0.0), getattr(member, "UNLOCK_FEE", 0.0))
+        fares = (
+            unlock
+            + per_minute * df["duration_minutes"].to_numpy(np.float64)
+            + per_km * df["distance_km"].to_numpy(np.float64)
+        )
+        rev = {
+            "casual": float(fares[is_casual].sum()),
+            "member": float(fares[~is_casual].sum()),
+        }
         return pd.Series(rev).round(2)
 
     # --------------------- Reporting ---------------------
 
     def export_outputs(self) -> None:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        self.top_start_stations().to_csv(OUTPUT_DIR / "top_stations.csv", index=False)
-        self.top_active_users().to_csv(OUTPUT_DIR / "top_users.csv", index=False)
+        _write_csv(self.top_start_stations(), OUTPUT_DIR / "top_stations.csv")
+        _write_csv(self.top_active_users(), OUTPUT_DIR / "top_users.csv")
         ms = self.maintenance_cost_by_bike_type().reset_index().rename(columns={"cost": "total_cost"})
-        ms.to_csv(OUTPUT_DIR / "maintenance_summary.csv", index=False)
+        _write_csv(ms, OUTPUT_DIR / "maintenance_summary.csv")
 
     def generate_summary_report(self) -> None:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         report_path = OUTPUT_DIR / "summary_report.txt"
 
         summary = self.total_trips_summary()
-        lines: list[str] = []
-        lines.append("=" * 70)
-        lines.append("CityBike — Summary Report")
-        lines.append("=" * 70)
+        # Tables are rendered straight into the report buffer, not into temporary strings
+        buf = io.StringIO()
+
+        def line(text: str) -> None:
+            buf.write(text)
+            buf.write("\n")
 
-        lines.append("\n--- Q1: Overall summary ---")
-        lines.append(f"Total trips: {summary['total_trips']}")
-        lines.append(f"Total distance: {summary['total_distance_km']} km")
-        lines.append(f"Average duration: {summary['avg_duration_min']} minutes")
+        def table(obj: pd.DataFrame | pd.Series, **kwargs) -> None:
+            obj.to_string(buf, **kwargs)
+            buf.write("\n")
 
-        lines.append("\n--- Q2: Top 10 start stations ---")
-        lines.append(self.top_start_stations(10).to_string(index=False))
+        line("=" * 70)
+        line("CityBike — Summary Report")
+        line("=" * 70)
 
-        lines.append("\n--- Q2b: Top 10 end stations ---")
-        lines.append(self.top_end_stations(10).to_string(index=False))
+        line("\n--- Q1: Overall summary ---")
+        line(f"Total trips: {summary['total_trips']}")
+        line(f"Total distance: {summary['total_distance_km']} km")
+        line(f"Average duration: {summary['avg_duration_min']} minutes")
 
-        lines.append("\n--- Q3: Peak usage hours ---")
-        lines.append(self.peak_usage_hours().to_string())
+        line("\n--- Q2: Top 10 start stations ---")
+        table(self.top_start_stations(10), index=False)
 
-        lines.append("\n--- Q4: Busiest day of week ---")
-        lines.append(self.busiest_day_of_week().to_string())
+        line("\n--- Q2b: Top 10 end stations ---")
+        table(self.top_end_stations(10), index=False)
 
-        lines.append("\n--- Q5: Avg distance by user type ---")
-        lines.append(self.avg_distance_by_user_type().to_string())
+        line("\n--- Q3: Peak usage hours ---")
+        table(self.peak_usage_hours())
 
-        lines.append("\n--- Q6: Bike utilization rate (approx) ---")
-        lines.append(f"{self.bike_utilization_rate():.4f} (share of time bikes are in use)")
+        line("\n--- Q4: Busiest day of week ---")
+        table(self.busiest_day_of_week())
 
-        lines.append("\n--- Q7: Monthly trip trend ---")
-        lines.append(self.monthly_trip_trend().to_string())
+        line("\n--- Q5: Avg distance by user type ---")
+        table(self.avg_distance_by_user_type())
 
-        lines.append("\n--- Q8: Top 15 active users ---")
-        lines.append(self.top_active_users(15).to_string(index=False))
+        line("\n--- Q6: Bike utilization rate (approx) ---")
+        line(f"{self.bike_utilization_rate():.4f} (share of time bikes are in use)")
 
-        lines.append("\n--- Q9: Maintenance cost by bike type ---")
-        lines.append(self.maintenance_cost_by_bike_type().to_string())
+        line("\n--- Q7: Monthly trip trend ---")
+        table(self.monthly_trip_trend())
 
-        lines.append("\n--- Q10: Top 10 routes ---")
-        lines.append(self.top_routes(10).to_string(index=False))
+        line("\n--- Q8: Top 15 active users ---")
+        table(self.top_active_users(15), index=False)
 
-        lines.append("\n--- Q11: Trip completion rate ---")
-        lines.append(self.trip_completion_rate().to_string())
+        line("\n--- Q9: Maintenance cost by bike type ---")
+        table(self.maintenance_cost_by_bike_type())
 
-        lines.append("\n--- Q12: Avg trips per user by type ---")
-        lines.append(self.avg_trips_per_user_by_type().to_string())
+        line("\n--- Q10: Top 10 routes ---")
+        table(self.top_routes(10), index=False)
 
-        lines.append("\n--- Q13: Bikes with highest maintenance frequency ---")
-        lines.append(self.bikes_highest_maintenance_frequency(10).to_string(index=False))
+        line("\n--- Q11: Trip completion rate ---")
+        table(self.trip_completion_rate())
 
-        lines.append("\n--- Q14: Outlier trips (z-score) ---")
+        line("\n--- Q12: Avg trips per user by type ---")
+        table(self.avg_trips_per_user_by_type())
+
+        line("\n--- Q13: Bikes with highest maintenance frequency ---")
+        table(self.bikes_highest_maintenance_frequency(10), index=False)
+
+        line("\n--- Q14: Outlier trips (z-score) ---")
         out = self.outlier_trips(threshold=3.0)
-        lines.append(out.head(20).to_string(index=False))
-        lines.append(f"Total outliers found: {len(out)}")
+        table(out.head(20), index=False)
+        line(f"Total outliers found: {len(out)}")
 
-        lines.append("\n--- Extra: Estimated revenue by user type ---")
-        lines.append(self.revenue_by_user_type().to_string())
+        line("\n--- Extra: Estimated revenue by user type ---")
+        table(self.revenue_by_user_type())
 
-        df = self._trips()
-        stats = trip_duration_stats(df["duration_minutes"].to_numpy())
-        lines.append("\n--- Extra: Duration stats (NumPy) ---")
-        for k, v in stats.items():
-            lines.append(f"{k}: {v:.3f}")
+        line("\n--- Extra: Duration stats (NumPy) ---")
+        for k, v in trip_duration_stats(self._trips()["duration_minutes"].to_numpy()).items():
+            line(f"{k}: {v:.3f}")
 
-        report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        report_path.write_text(buf.getvalue(), encoding="utf-8")
         print(f"Report saved to {report_path}")
 
     # --------------------- Internal helpers ---------------------
@@ -318,11 +433,23 @@ class BikeShareSystem:
             raise RuntimeError("Trips not loaded")
         return self.trips
 
+    def _trips_with_start_parts(self) -> pd.DataFrame:
+        """Trips with the calendar columns, deriving and caching them if they are missing."""
+        df = self._trips()
+        if not set(DERIVED_TRIP_COLUMNS).issubset(df.columns):
+            df = df.copy()  # don't add columns to a frame the caller handed in
+            _add_start_parts(df)
+            self.trips = df
+        return df
+
     def _stations(self) -> pd.DataFrame:
         if self.stations is None:
             raise RuntimeError("Stations not loaded")
         return self.stations
 
+    def _station_names(self) -> pd.Series:
+        return self._stations().set_index("station_id")["station_name"]
+
     def _maint(self) -> pd.DataFrame:
         if self.maintenance is None:
             raise RuntimeError("Maintenance not loaded")
@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 from pathlib import Path
 
 np.random.seed(42)
@@ -29,56 +28,45 @@ station_names = [
     "Business District", "Lakeside", "Airport Terminal"
 ]
 
-stations = []
-for i, name in enumerate(station_names):
-    stations.append({
-        "station_id": f"ST{100 + i}",
-        "station_name": name,
-        "capacity": int(np.random.choice([10, 15, 20, 25, 30])),
-        "latitude": round(48.75 + np.random.uniform(0, 0.15), 6),
-        "longitude": round(9.15 + np.random.uniform(0, 0.15), 6),
-    })
-
-stations_df = pd.DataFrame(stations)
+n_stations = len(station_names)
+stations_df = pd.DataFrame({
+    "station_id": [f"ST{100 + i}" for i in range(n_stations)],
+    "station_name": station_names,
+    "capacity": np.random.choice([10, 15, 20, 25, 30], size=n_stations),
+    "latitude": np.round(48.75 + np.random.uniform(0, 0.15, size=n_stations), 6),
+    "longitude": np.round(9.15 + np.random.uniform(0, 0.15, size=n_stations), 6),
+})
 stations_df.to_csv(DATA_DIR / "stations.csv", index=False)
 
 n_trips = 1500
-user_ids = [f"USR{np.random.randint(1000, 1200)}" for _ in range(80)]
-bike_ids = [f"BK{np.random.randint(200, 350)}" for _ in range(60)]
-start_date = datetime(2024, 1, 1)
-
-trips = []
-for i in range(n_trips):
-    user_type = np.random.choice(["casual", "member"], p=[0.35, 0.65])
-    bike_type = np.random.choice(["classic", "electric"], p=[0.6, 0.4])
-    start_st = np.random.choice(stations_df["station_id"])
-    end_st = np.random.choice(stations_df["station_id"])
-    start_time = start_date + timedelta(
-        days=int(np.random.randint(0, 365)),
-        hours=int(np.random.randint(6, 23)),
-        minutes=int(np.random.randint(0, 60)),
-    )
-    duration = max(2, float(np.random.exponential(25)))
-    end_time = start_time + timedelta(minutes=duration)
-    distance = round(float(np.random.uniform(0.5, 15.0)), 2)
-    status = np.random.choice(["completed", "cancelled", np.nan], p=[0.82, 0.12, 0.06])
-
-    trips.append({
-        "trip_id": f"TR{10000 + i}",
-        "user_id": str(np.random.choice(user_ids)),
-        "user_type": str(user_type),
-        "bike_id": str(np.random.choice(bike_ids)),
-        "bike_type": str(bike_type),
-        "start_station_id": str(start_st),
-        "end_station_id": str(end_st),
-        "start_time": start_time.strftime("%Y-%m-%d %H:%M:%S"),
-        "end_time": end_time.strftime("%Y-%m-%d %H:%M:%S"),
-        "duration_minutes": round(duration, 1),
-        "distance_km": distance,
-        "status": status,
-    })
-
-trips_df = pd.DataFrame(trips)
+user_ids = np.array([f"USR{u}" for u in np.random.randint(1000, 1200, size=80)])
+bike_ids = np.array([f"BK{b}" for b in np.random.randint(200, 350, size=60)])
+start_date = np.datetime64("2024-01-01 00:00:00", "s")
+
+# Each column is drawn in one call instead of one NumPy call per row.
+start_offsets = (
+    np.random.randint(0, 365, size=n_trips) * 86400
+    + np.random.randint(6, 23, size=n_trips) * 3600
+    + np.random.randint(0, 60, size=n_trips) * 60
+)
+start_times = start_date + start_offsets.astype("timedelta64[s]")
+durations = np.maximum(2, np.random.exponential(25, size=n_trips))
+end_times = start_times + (durations * 60).astype("timedelta64[s]")
+
+trips_df = pd.DataFrame({
+    "trip_id": [f"TR{10000 + i}" for i in range(n_trips)],
+    "user_id": np.random.choice(user_ids, size=n_trips),
+    "user_type": np.random.choice(["casual", "member"], size=n_trips, p=[0.35, 0.65]),
+    "bike_id": np.random.choice(bike_ids, size=n_trips),
+    "bike_type": np.random.choice(["classic", "electric"], size=n_trips, p=[0.6, 0.4]),
+    "start_station_id": np.random.choice(stations_df["station_id"], size=n_trips),
+    "end_station_id": np.random.choice(stations_df["station_id"], size=n_trips),
+    "start_time": pd.Series(start_times).dt.strftime("%Y-%m-%d %H:%M:%S"),
+    "end_time": pd.Series(end_times).dt.strftime("%Y-%m-%d %H:%M:%S"),
+    "duration_minutes": np.round(durations, 1),
+    "distance_km": np.round(np.random.uniform(0.5, 15.0, size=n_trips), 2),
+    "status": np.random.choice(["completed", "cancelled", np.nan], size=n_trips, p=[0.82, 0.12, 0.06]),
+})
 
 # Inject messiness
 idx = np.random.choice(n_trips, 30, replace=False)
@@ -96,28 +84,31 @@ maint_types = [
     "general_inspection"
 ]
 
-records = []
-for i in range(200):
-    bike = str(np.random.choice(bike_ids))
-    btype = str(np.random.choice(["classic", "electric"]))
-    mtype = str(np.random.choice(maint_types))
-    cost = round(float(np.random.uniform(10, 150)), 2)
-    if mtype == "battery_replacement":
-        cost = round(float(np.random.uniform(80, 250)), 2)
-        btype = "electric"
-
-    records.append({
-        "record_id": f"MR{5000 + i}",
-        "bike_id": bike,
-        "bike_type": btype,
-        "date": (start_date + timedelta(days=int(np.random.randint(0, 365)))).strftime("%Y-%m-%d"),
-        "maintenance_type": mtype,
-        "cost": cost,
-        "description": f"{mtype.replace('_', ' ').title()} for bike {bike}",
-    })
-
-maint_df = pd.DataFrame(records)
-maint_df.loc[np.random.choice(200, 8, replace=False), "cost"] = np.nan
+n_records = 200
+bikes = np.random.choice(bike_ids, size=n_records)
+mtypes = np.random.choice(maint_types, size=n_records)
+is_battery = mtypes == "battery_replacement"
+btypes = np.where(is_battery, "electric", np.random.choice(["classic", "electric"], size=n_records))
+costs = np.round(
+    np.where(
+        is_battery,
+        np.random.uniform(80, 250, size=n_records),
+        np.random.uniform(10, 150, size=n_records),
+    ),
+    2,
+)
+dates = start_date + (np.random.randint(0, 365, size=n_records) * 86400).astype("timedelta64[s]")
+
+maint_df = pd.DataFrame({
+    "record_id": [f"MR{5000 + i}" for i in range(n_records)],
+    "bike_id": bikes,
+    "bike_type": btypes,
+    "date": pd.Series(dates).dt.strftime("%Y-%m-%d"),
+    "maintenance_type": mtypes,
+    "cost": costs,
+    "description": [f"{m.replace('_', ' ').title()} for bike {b}" for m, b in zip(mtypes, bikes)],
+})
+maint_df.loc[np.random.choice(n_records, 8, replace=False), "cost"] = np.nan
 maint_df.to_csv(DATA_DIR / "maintenance.csv", index=False)
 
 print("Generated: data/stations.csv, data/trips.csv, data/maintenance.csv")
@@ -13,7 +13,7 @@ from visualization import (
     plot_duration_histogram,
     plot_duration_by_user_type,
 )
-from algorithms import benchmark_sort, benchmark_search, merge_sort
+from algorithms import benchmark_sort, benchmark_search, fast_merge_sort
 
 
 def ensure_input_csvs() -> str | None:
@@ -79,8 +79,8 @@ def main() -> None:
     if len(durations) < 5:
         print("Not enough duration data for benchmarks.")
     else:
-        sort_bench = benchmark_sort(durations, key=lambda x: x, repeats=5)
-        sorted_durations = merge_sort(durations, key=lambda x: x)
+        sort_bench = benchmark_sort(durations, repeats=5)
+        sorted_durations = fast_merge_sort(durations)
 
         target = sorted_durations[len(sorted_durations) // 2]
         search_bench = benchmark_search(sorted_durations, target=target, key=lambda x: x, repeats=5)
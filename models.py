@@ -2,30 +2,71 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from utils import (
+    BIKE_CLASSIC,
+    BIKE_ELECTRIC,
+    USER_CASUAL,
+    USER_MEMBER,
+    TRIP_COMPLETED,
     VALID_BIKE_TYPES,
     VALID_TRIP_STATUSES,
     VALID_USER_TYPES,
     VALID_MAINTENANCE_TYPES,
+    intern_label,
     validate_email,
     validate_in,
     validate_non_negative,
     validate_positive,
 )
 
+# Default created_at stamp, refreshed at most every ``_NOW_TTL`` seconds so
+# bulk construction doesn't hit the system clock once per object.
+_NOW_TTL = 0.5
+_NOW_CACHE = [datetime.now(), time.monotonic()]
+
+
+def _now_cached(ttl: float = _NOW_TTL) -> datetime:
+    """Return a wall-clock timestamp that is at most ``ttl`` seconds stale."""
+    mono = time.monotonic()
+    if mono - _NOW_CACHE[1] > ttl:
+        _NOW_CACHE[0] = datetime.now()
+        _NOW_CACHE[1] = mono
+    return _NOW_CACHE[0]
+
+
+def _as_float(x: Any) -> float:
+    """Return ``x`` as a float, reusing the object when it already is one."""
+    return x if type(x) is float else float(x)
+
 
 class Entity(ABC):
     """Abstract base class for all domain entities."""
 
+    __slots__ = ("_id", "_created_at")
+
     def __init__(self, id: str, created_at: datetime | None = None) -> None:
         if not id or not isinstance(id, str):
             raise ValueError("id must be a non-empty string")
         self._id = id
-        self._created_at = created_at or datetime.now()
+        self._created_at = created_at or _now_cached()
+
+    @classmethod
+    def _new_unchecked(cls, id: str, created_at: datetime | None = None):
+        """Allocate an instance with only the Entity slots set, skipping validation.
+
+        The ``_unchecked`` constructors built on this store their arguments as given.
+        Callers must pass values already in the form ``__init__`` stores them: stripped
+        strings, floats, and labels interned via ``intern_label`` (or the utils constants).
+        """
+        obj = object.__new__(cls)
+        obj._id = id
+        obj._created_at = created_at or _now_cached()
+        return obj
 
     @property
     def id(self) -> str:
@@ -45,14 +86,25 @@ class Entity(ABC):
 class Bike(Entity):
     """Represents a bike."""
 
-    VALID_STATUSES = {"available", "in_use", "maintenance"}
+    __slots__ = ("_bike_type", "_status")
+    VALID_STATUSES = frozenset({"available", "in_use", "maintenance"})
 
     def __init__(self, bike_id: str, bike_type: str, status: str = "available") -> None:
         super().__init__(id=bike_id)
         validate_in(bike_type, VALID_BIKE_TYPES, "bike_type")
         validate_in(status, self.VALID_STATUSES, "status")
-        self._bike_type = bike_type
-        self._status = status
+        self._bike_type = intern_label(bike_type)
+        self._status = intern_label(status)
+
+    @classmethod
+    def _unchecked(
+        cls, bike_id: str, bike_type: str, status: str = "available", created_at: datetime | None = None
+    ) -> Bike:
+        """Build from already-normalized data (e.g. a schema-checked file) without re-validating."""
+        obj = cls._new_unchecked(bike_id, created_at)
+        obj._bike_type = bike_type
+        obj._status = status
+        return obj
 
     @property
     def bike_type(self) -> str:
@@ -65,7 +117,7 @@ class Bike(Entity):
     @status.setter
     def status(self, value: str) -> None:
         validate_in(value, self.VALID_STATUSES, "status")
-        self._status = value
+        self._status = intern_label(value)
 
     def __str__(self) -> str:
         return f"Bike({self.id}, {self.bike_type}, {self.status})"
@@ -75,12 +127,24 @@ class Bike(Entity):
 
 
 class ClassicBike(Bike):
+    __slots__ = ("_gear_count",)
+
     def __init__(self, bike_id: str, gear_count: int = 7, status: str = "available") -> None:
-        super().__init__(bike_id=bike_id, bike_type="classic", status=status)
+        super().__init__(bike_id=bike_id, bike_type=BIKE_CLASSIC, status=status)
         if not isinstance(gear_count, int) or gear_count <= 0:
             raise ValueError("gear_count must be a positive int")
         self._gear_count = gear_count
 
+    @classmethod
+    def _unchecked(
+        cls, bike_id: str, gear_count: int = 7, status: str = "available", created_at: datetime | None = None
+    ) -> ClassicBike:
+        obj = cls._new_unchecked(bike_id, created_at)
+        obj._bike_type = BIKE_CLASSIC
+        obj._status = status
+        obj._gear_count = gear_count
+        return obj
+
     @property
     def gear_count(self) -> int:
         return self._gear_count
@@ -93,6 +157,8 @@ class ClassicBike(Bike):
 
 
 class ElectricBike(Bike):
+    __slots__ = ("_battery_level", "_max_range_km")
+
     def __init__(
         self,
         bike_id: str,
@@ -100,12 +166,32 @@ class ElectricBike(Bike):
         max_range_km: float = 50.0,
         status: str = "available",
     ) -> None:
-        super().__init__(bike_id=bike_id, bike_type="electric", status=status)
-        if not isinstance(battery_level, (int, float)) or not (0.0 <= float(battery_level) <= 100.0):
+        super().__init__(bike_id=bike_id, bike_type=BIKE_ELECTRIC, status=status)
+        if not isinstance(battery_level, (int, float)):
+            raise ValueError("battery_level must be between 0 and 100")
+        battery_level = _as_float(battery_level)
+        if not (0.0 <= battery_level <= 100.0):
             raise ValueError("battery_level must be between 0 and 100")
-        validate_positive(float(max_range_km), "max_range_km")
-        self._battery_level = float(battery_level)
-        self._max_range_km = float(max_range_km)
+        max_range_km = _as_float(max_range_km)
+        validate_positive(max_range_km, "max_range_km")
+        self._battery_level = battery_level
+        self._max_range_km = max_range_km
+
+    @classmethod
+    def _unchecked(
+        cls,
+        bike_id: str,
+        battery_level: float = 100.0,
+        max_range_km: float = 50.0,
+        status: str = "available",
+        created_at: datetime | None = None,
+    ) -> ElectricBike:
+        obj = cls._new_unchecked(bike_id, created_at)
+        obj._bike_type = BIKE_ELECTRIC
+        obj._status = status
+        obj._battery_level = battery_level
+        obj._max_range_km = max_range_km
+        return obj
 
     @property
     def battery_level(self) -> float:
@@ -113,9 +199,10 @@ class ElectricBike(Bike):
 
     @battery_level.setter
     def battery_level(self, value: float) -> None:
-        if not (0.0 <= float(value) <= 100.0):
+        value = _as_float(value)
+        if not (0.0 <= value <= 100.0):
             raise ValueError("battery_level must be between 0 and 100")
-        self._battery_level = float(value)
+        self._battery_level = value
 
     @property
     def max_range_km(self) -> float:
@@ -135,14 +222,16 @@ class ElectricBike(Bike):
 
 
 class Station(Entity):
+    __slots__ = ("_name", "_capacity", "_latitude", "_longitude")
+
     def __init__(self, station_id: str, name: str, capacity: int, latitude: float, longitude: float) -> None:
         super().__init__(id=station_id)
         if not isinstance(name, str) or not name.strip():
             raise ValueError("name must be a non-empty string")
         if not isinstance(capacity, int) or capacity <= 0:
             raise ValueError("capacity must be a positive int")
-        lat = float(latitude)
-        lon = float(longitude)
+        lat = _as_float(latitude)
+        lon = _as_float(longitude)
         if not (-90.0 <= lat <= 90.0):
             raise ValueError("latitude must be in [-90, 90]")
         if not (-180.0 <= lon <= 180.0):
@@ -152,6 +241,24 @@ class Station(Entity):
         self._latitude = lat
         self._longitude = lon
 
+    @classmethod
+    def _unchecked(
+        cls,
+        station_id: str,
+        name: str,
+        capacity: int,
+        latitude: float,
+        longitude: float,
+        created_at: datetime | None = None,
+    ) -> Station:
+        """Build from already-normalized data without re-validating."""
+        obj = cls._new_unchecked(station_id, created_at)
+        obj._name = name
+        obj._capacity = capacity
+        obj._latitude = latitude
+        obj._longitude = longitude
+        return obj
+
     @property
     def name(self) -> str:
         return self._name
@@ -179,6 +286,8 @@ class Station(Entity):
 
 
 class User(Entity):
+    __slots__ = ("_name", "_email", "_user_type")
+
     def __init__(self, user_id: str, name: str, email: str, user_type: str) -> None:
         super().__init__(id=user_id)
         if not isinstance(name, str) or not name.strip():
@@ -187,7 +296,18 @@ class User(Entity):
         validate_in(user_type, VALID_USER_TYPES, "user_type")
         self._name = name.strip()
         self._email = email.strip()
-        self._user_type = user_type
+        self._user_type = intern_label(user_type)
+
+    @classmethod
+    def _unchecked(
+        cls, user_id: str, name: str, email: str, user_type: str, created_at: datetime | None = None
+    ) -> User:
+        """Build from already-normalized data without re-validating."""
+        obj = cls._new_unchecked(user_id, created_at)
+        obj._name = name
+        obj._email = email
+        obj._user_type = user_type
+        return obj
 
     @property
     def name(self) -> str:
@@ -209,12 +329,25 @@ class User(Entity):
 
 
 class CasualUser(User):
+    __slots__ = ("_day_pass_count",)
+
     def __init__(self, user_id: str, name: str, email: str, day_pass_count: int = 0) -> None:
-        super().__init__(user_id=user_id, name=name, email=email, user_type="casual")
+        super().__init__(user_id=user_id, name=name, email=email, user_type=USER_CASUAL)
         if not isinstance(day_pass_count, int) or day_pass_count < 0:
             raise ValueError("day_pass_count must be an int >= 0")
         self._day_pass_count = day_pass_count
 
+    @classmethod
+    def _unchecked(
+        cls, user_id: str, name: str, email: str, day_pass_count: int = 0, created_at: datetime | None = None
+    ) -> CasualUser:
+        obj = cls._new_unchecked(user_id, created_at)
+        obj._name = name
+        obj._email = email
+        obj._user_type = USER_CASUAL
+        obj._day_pass_count = day_pass_count
+        return obj
+
     @property
     def day_pass_count(self) -> int:
         return self._day_pass_count
@@ -230,6 +363,9 @@ class CasualUser(User):
 
 
 class MemberUser(User):
+    __slots__ = ("_membership_start", "_membership_end", "_tier")
+    _TIERS = frozenset({"basic", "premium"})
+
     def __init__(
         self,
         user_id: str,
@@ -239,16 +375,36 @@ class MemberUser(User):
         membership_end: datetime | None = None,
         tier: str = "basic",
     ) -> None:
-        super().__init__(user_id=user_id, name=name, email=email, user_type="member")
-        if tier not in {"basic", "premium"}:
+        super().__init__(user_id=user_id, name=name, email=email, user_type=USER_MEMBER)
+        if tier not in self._TIERS:
             raise ValueError("tier must be 'basic' or 'premium'")
-        start = membership_start or datetime.now()
+        start = membership_start or _now_cached()
         end = membership_end or start.replace(year=start.year + 1)
         if end <= start:
             raise ValueError("membership_end must be after membership_start")
         self._membership_start = start
         self._membership_end = end
-        self._tier = tier
+        self._tier = intern_label(tier)
+
+    @classmethod
+    def _unchecked(
+        cls,
+        user_id: str,
+        name: str,
+        email: str,
+        membership_start: datetime,
+        membership_end: datetime,
+        tier: str = "basic",
+        created_at: datetime | None = None,
+    ) -> MemberUser:
+        obj = cls._new_unchecked(user_id, created_at)
+        obj._name = name
+        obj._email = email
+        obj._user_type = USER_MEMBER
+        obj._membership_start = membership_start
+        obj._membership_end = membership_end
+        obj._tier = tier
+        return obj
 
     @property
     def membership_start(self) -> datetime:
@@ -273,6 +429,19 @@ class MemberUser(User):
 
 
 class Trip:
+    __slots__ = (
+        "trip_id",
+        "user",
+        "bike",
+        "start_station",
+        "end_station",
+        "_start_time",
+        "_end_time",
+        "duration_minutes",
+        "distance_km",
+        "status",
+    )
+
     def __init__(
         self,
         trip_id: str,
@@ -283,28 +452,78 @@ class Trip:
         start_time: datetime,
         end_time: datetime,
         distance_km: float,
-        status: str = "completed",
+        status: str = TRIP_COMPLETED,
     ) -> None:
         if not trip_id or not isinstance(trip_id, str):
             raise ValueError("trip_id must be a non-empty string")
         if end_time < start_time:
             raise ValueError("end_time must be >= start_time")
-        validate_non_negative(float(distance_km), "distance_km")
+        distance_km = _as_float(distance_km)
+        validate_non_negative(distance_km, "distance_km")
         validate_in(status, VALID_TRIP_STATUSES, "status")
         self.trip_id = trip_id
         self.user = user
         self.bike = bike
         self.start_station = start_station
         self.end_station = end_station
-        self.start_time = start_time
-        self.end_time = end_time
-        self.distance_km = float(distance_km)
-        self.status = status
+        self._start_time = start_time
+        self._end_time = end_time
+        self.duration_minutes = (end_time - start_time).total_seconds() / 60.0
+        self.distance_km = distance_km
+        self.status = intern_label(status)
+
+    @classmethod
+    def _unchecked(
+        cls,
+        trip_id: str,
+        user: User,
+        bike: Bike,
+        start_station: Station,
+        end_station: Station,
+        start_time: datetime,
+        end_time: datetime,
+        distance_km: float,
+        status: str = TRIP_COMPLETED,
+        *,
+        duration_minutes: float,
+    ) -> Trip:
+        """Build from already-normalized data without re-validating.
+
+        Positional arguments match ``__init__``. The keyword-only *duration_minutes* is
+        trusted too (e.g. the trips_clean.csv column) rather than recomputed; see
+        ``Entity._new_unchecked`` for the form arguments must take.
+        """
+        obj = object.__new__(cls)
+        obj.trip_id = trip_id
+        obj.user = user
+        obj.bike = bike
+        obj.start_station = start_station
+        obj.end_station = end_station
+        obj._start_time = start_time
+        obj._end_time = end_time
+        obj.duration_minutes = duration_minutes
+        obj.distance_km = distance_km
+        obj.status = status
+        return obj
+
+    # duration_minutes is stored at construction; the time setters keep it in sync.
+    @property
+    def start_time(self) -> datetime:
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, value: datetime) -> None:
+        self._start_time = value
+        self.duration_minutes = (self._end_time - value).total_seconds() / 60.0
 
     @property
-    def duration_minutes(self) -> float:
-        delta = self.end_time - self.start_time
-        return delta.total_seconds() / 60.0
+    def end_time(self) -> datetime:
+        return self._end_time
+
+    @end_time.setter
+    def end_time(self, value: datetime) -> None:
+        self._end_time = value
+        self.duration_minutes = (value - self._start_time).total_seconds() / 60.0
 
     def __str__(self) -> str:
         return f"Trip({self.trip_id}, {self.user.id}->{self.start_station.id}->{self.end_station.id}, {self.duration_minutes:.1f}min)"
@@ -318,6 +537,7 @@ class Trip:
 
 
 class MaintenanceRecord:
+    __slots__ = ("record_id", "bike", "date", "maintenance_type", "cost", "description")
     VALID_TYPES = VALID_MAINTENANCE_TYPES
 
     def __init__(
@@ -332,14 +552,35 @@ class MaintenanceRecord:
         if not record_id or not isinstance(record_id, str):
             raise ValueError("record_id must be a non-empty string")
         validate_in(maintenance_type, self.VALID_TYPES, "maintenance_type")
-        validate_non_negative(float(cost), "cost")
+        cost = _as_float(cost)
+        validate_non_negative(cost, "cost")
         self.record_id = record_id
         self.bike = bike
         self.date = date
-        self.maintenance_type = maintenance_type
-        self.cost = float(cost)
+        self.maintenance_type = intern_label(maintenance_type)
+        self.cost = cost
         self.description = str(description or "")
 
+    @classmethod
+    def _unchecked(
+        cls,
+        record_id: str,
+        bike: Bike,
+        date: datetime,
+        maintenance_type: str,
+        cost: float,
+        description: str = "",
+    ) -> MaintenanceRecord:
+        """Build from already-normalized data without re-validating."""
+        obj = object.__new__(cls)
+        obj.record_id = record_id
+        obj.bike = bike
+        obj.date = date
+        obj.maintenance_type = maintenance_type
+        obj.cost = cost
+        obj.description = description
+        return obj
+
     def __str__(self) -> str:
         return f"MaintenanceRecord({self.record_id}, bike={self.bike.id}, type={self.maintenance_type}, cost={self.cost:.2f})"
 
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class PricingStrategy(ABC):
@@ -12,6 +16,17 @@ class PricingStrategy(ABC):
     def calculate_cost(self, duration_minutes: float, distance_km: float) -> float:
         ...
 
+    def calculate_costs(self, durations: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        """Batch version of calculate_cost over arrays of trips.
+
+        The default applies calculate_cost per trip; linear strategies override it
+        with a vectorized pass.
+        """
+        import numpy as np
+
+        cost = np.frompyfunc(self.calculate_cost, 2, 1)
+        return cost(np.asarray(durations, dtype=float), np.asarray(distances, dtype=float)).astype(float)
+
 
 class CasualPricing(PricingStrategy):
     """Pricing for casual users."""
@@ -22,6 +37,11 @@ class CasualPricing(PricingStrategy):
     def calculate_cost(self, duration_minutes: float, distance_km: float) -> float:
         return self.UNLOCK_FEE + self.PER_MINUTE * duration_minutes + self.PER_KM * distance_km
 
+    def calculate_costs(self, durations: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        from numerical import calculate_fares
+
+        return calculate_fares(durations, distances, self.PER_MINUTE, self.PER_KM, self.UNLOCK_FEE)
+
 
 class MemberPricing(PricingStrategy):
     """Pricing for member users — discounted rates."""
@@ -31,6 +51,11 @@ class MemberPricing(PricingStrategy):
     def calculate_cost(self, duration_minutes: float, distance_km: float) -> float:
         return self.PER_MINUTE * duration_minutes + self.PER_KM * distance_km
 
+    def calculate_costs(self, durations: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        from numerical import calculate_fares
+
+        return calculate_fares(durations, distances, self.PER_MINUTE, self.PER_KM)
+
 
 class PeakHourPricing(PricingStrategy):
     """Peak-hour pricing (surcharge multiplier on top of casual cost)."""
@@ -41,3 +66,6 @@ class PeakHourPricing(PricingStrategy):
 
     def calculate_cost(self, duration_minutes: float, distance_km: float) -> float:
         return self.MULTIPLIER * self._base.calculate_cost(duration_minutes, distance_km)
+
+    def calculate_costs(self, durations: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        return self.MULTIPLIER * self._base.calculate_costs(durations, distances)
@@ -0,0 +1,94 @@
+"""Columnar view of Trip objects for bulk analytics on the CityBike platform."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from models import Trip
+
+
+def _encode(values: list[str]) -> tuple[np.ndarray, list[str]]:
+    """Dictionary-encode *values* into int32 codes and the list of distinct values."""
+    index: dict[str, int] = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int32, count=len(values))
+    return codes, list(index)
+
+
+class TripTable:
+    """Columnar (structure-of-arrays) view of many trips for analytics passes.
+
+    Ids and labels are stored as int32 codes into small per-column dictionaries;
+    timestamps are int64 seconds since the epoch.
+    """
+
+    __slots__ = (
+        "trip_ids",
+        "start_ts",
+        "end_ts",
+        "duration_minutes",
+        "distance_km",
+        "user_idx",
+        "bike_idx",
+        "start_station_idx",
+        "end_station_idx",
+        "user_type_codes",
+        "bike_type_codes",
+        "status_codes",
+        "user_ids",
+        "bike_ids",
+        "station_ids",
+        "user_types",
+        "bike_types",
+        "statuses",
+    )
+
+    @classmethod
+    def from_trips(cls, trips: list[Trip]) -> TripTable:
+        n = len(trips)
+        table = cls.__new__(cls)
+        table.trip_ids = np.array([t.trip_id for t in trips], dtype=object)
+        table.start_ts = np.array([t.start_time for t in trips], dtype="datetime64[s]").astype(np.int64)
+        table.end_ts = np.array([t.end_time for t in trips], dtype="datetime64[s]").astype(np.int64)
+        table.duration_minutes = np.fromiter((t.duration_minutes for t in trips), dtype=np.float64, count=n)
+        table.distance_km = np.fromiter((t.distance_km for t in trips), dtype=np.float64, count=n)
+        table.user_idx, table.user_ids = _encode([t.user.id for t in trips])
+        table.bike_idx, table.bike_ids = _encode([t.bike.id for t in trips])
+        station_codes, table.station_ids = _encode(
+            [t.start_station.id for t in trips] + [t.end_station.id for t in trips]
+        )
+        table.start_station_idx = station_codes[:n]
+        table.end_station_idx = station_codes[n:]
+        table.user_type_codes, table.user_types = _encode([t.user.user_type for t in trips])
+        table.bike_type_codes, table.bike_types = _encode([t.bike.bike_type for t in trips])
+        table.status_codes, table.statuses = _encode([t.status for t in trips])
+        return table
+
+    def __len__(self) -> int:
+        return len(self.trip_ids)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the table with the same columns as the trips CSV (labels as categoricals)."""
+        def cat(codes: np.ndarray, categories: list[str]) -> pd.Categorical:
+            return pd.Categorical.from_codes(codes, categories=categories)
+
+        return pd.DataFrame({
+            "trip_id": self.trip_ids,
+            "user_id": cat(self.user_idx, self.user_ids),
+            "user_type": cat(self.user_type_codes, self.user_types),
+            "bike_id": cat(self.bike_idx, self.bike_ids),
+            "bike_type": cat(self.bike_type_codes, self.bike_types),
+            "start_station_id": cat(self.start_station_idx, self.station_ids),
+            "end_station_id": cat(self.end_station_idx, self.station_ids),
+            "start_time": self.start_ts.astype("datetime64[s]"),
+            "end_time": self.end_ts.astype("datetime64[s]"),
+            "duration_minutes": self.duration_minutes,
+            "distance_km": self.distance_km,
+            "status": cat(self.status_codes, self.statuses),
+        })
+
+    def __str__(self) -> str:
+        return f"TripTable({len(self)} trips)"
+
+    def __repr__(self) -> str:
+        return f"TripTable(n_trips={len(self)}, n_users={len(self.user_ids)}, n_stations={len(self.station_ids)})"
@@ -6,22 +6,35 @@ Pure helper functions for validation, parsing, and formatting.
 from __future__ import annotations  # باعث می‌شه type hintها به‌صورت رشته (lazy) تفسیر بشن.
 
 import re
+import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-VALID_BIKE_TYPES = {"classic", "electric"}
-VALID_USER_TYPES = {"casual", "member"}
-VALID_TRIP_STATUSES = {"completed", "cancelled"}
-VALID_MAINTENANCE_TYPES = {
+# Interned so every model holding one of these labels shares a single str object.
+BIKE_CLASSIC = sys.intern("classic")
+BIKE_ELECTRIC = sys.intern("electric")
+USER_CASUAL = sys.intern("casual")
+USER_MEMBER = sys.intern("member")
+TRIP_COMPLETED = sys.intern("completed")
+TRIP_CANCELLED = sys.intern("cancelled")
+
+VALID_BIKE_TYPES = frozenset({BIKE_CLASSIC, BIKE_ELECTRIC})
+VALID_USER_TYPES = frozenset({USER_CASUAL, USER_MEMBER})
+VALID_TRIP_STATUSES = frozenset({TRIP_COMPLETED, TRIP_CANCELLED})
+VALID_MAINTENANCE_TYPES = frozenset({
     "tire_repair",
     "brake_adjustment",
     "battery_replacement",
     "chain_lubrication",
     "general_inspection",
-}
+})
+
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
 
 def validate_positive(value: float, name: str = "value") -> float:
@@ -39,26 +52,48 @@ def validate_non_negative(value: float, name: str = "value") -> float:
 
 
 def validate_email(email: str) -> str:
-    """Basic email validation."""
-    if not isinstance(email, str) or "@" not in email:
+    """Basic email validation: local@domain.tld, ignoring surrounding whitespace."""
+    if not isinstance(email, str) or _EMAIL_RE.fullmatch(email.strip()) is None:
         raise ValueError(f"Invalid email: {email!r}")
     return email
 
 
-def validate_in(value: Any, allowed: set, name: str = "value") -> Any:
+def validate_in(value: Any, allowed: frozenset, name: str = "value") -> Any:
     """Ensure *value* is in *allowed*."""
     if value not in allowed:
-        raise ValueError(f"{name} must be one of {allowed}, got {value!r}")
+        raise ValueError(f"{name} must be one of {set(allowed)}, got {value!r}")
     return value
 
 
+def intern_label(value: str) -> str:
+    """Return the interned copy of a small enum-like label (str subclasses included)."""
+    return sys.intern(str(value))
+
+
 def parse_datetime(text: str) -> datetime:
     """Parse a datetime string in YYYY-MM-DD HH:MM:SS format."""
-    return datetime.strptime(text, DATETIME_FORMAT)
+    return _parse_datetime_cached(text)
 
 
 def parse_date(text: str) -> datetime:
     """Parse a date string in YYYY-MM-DD format."""
+    return _parse_date_cached(text)
+
+
+# Bulk ingest sees the same timestamps over and over; datetimes are immutable, so
+# parsed values can be shared. The exact layouts go through the C fromisoformat parser
+# (which checks the digits); anything else keeps strptime's behaviour.
+@lru_cache(maxsize=1 << 20)
+def _parse_datetime_cached(text: str) -> datetime:
+    if len(text) == 19 and text[4] == text[7] == "-" and text[10] == " " and text[13] == text[16] == ":":
+        return datetime.fromisoformat(text)
+    return datetime.strptime(text, DATETIME_FORMAT)
+
+
+@lru_cache(maxsize=1 << 20)
+def _parse_date_cached(text: str) -> datetime:
+    if len(text) == 10 and text[4] == text[7] == "-":
+        return datetime.fromisoformat(text)
     return datetime.strptime(text, DATE_FORMAT)
 
 
@@ -77,5 +112,5 @@ def fmt_currency(amount: float) -> str:
 def slug(text: str) -> str:
     """Simple slugifier for filenames."""
     text = text.strip().lower()
-    text = re.sub(r"[^a-z0-9]+", "_", text)
+    text = _SLUG_RE.sub("_", text)
     return text.strip("_")
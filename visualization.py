@@ -2,36 +2,46 @@
 
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
 import pandas as pd
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pathlib import Path
 
 FIGURES_DIR = Path(__file__).resolve().parent / "output" / "figures"
 
+# One Figure reused across plots (cleared in between) instead of a pyplot figure per plot.
+# It renders through its own Agg canvas, so the process-wide pyplot backend is left alone.
+_FIG: Figure | None = None
 
-def _save_figure(fig: plt.Figure, filename: str) -> None:
+
+def _get_fig(figsize: tuple[float, float]) -> tuple[Figure, Axes]:
+    global _FIG
+    if _FIG is None:
+        _FIG = Figure(figsize=figsize)
+        FigureCanvasAgg(_FIG)
+    else:
+        _FIG.clf()
+        _FIG.set_size_inches(*figsize)
+    return _FIG, _FIG.add_subplot()
+
+
+def _save_figure(fig: Figure, filename: str) -> None:
     FIGURES_DIR.mkdir(parents=True, exist_ok=True)
     filepath = FIGURES_DIR / filename
     fig.savefig(filepath, dpi=150, bbox_inches="tight")
-    plt.close(fig)
     print(f"Saved: {filepath}")
 
 
 def plot_trips_per_station(trips: pd.DataFrame, stations: pd.DataFrame) -> None:
-    counts = (
-        trips["start_station_id"]
-        .value_counts()
-        .head(10)
-        .rename_axis("station_id")
-        .reset_index(name="trip_count")
-    )
-    merged = counts.merge(
-        stations[["station_id", "station_name"]],
-        on="station_id",
-        how="left",
-    )
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.barh(merged["station_name"], merged["trip_count"])
+    # nlargest keeps a size-10 heap rather than sorting every station's count
+    top = trips.groupby("start_station_id", sort=False, observed=True).size().nlargest(10)
+    # Ten lookups don't need a merge; fall back to the id for unknown stations
+    name_map = dict(zip(stations["station_id"].to_numpy(), stations["station_name"].to_numpy()))
+    ids = top.index.astype(str)
+    labels = [name_map.get(sid, sid) for sid in ids]
+    fig, ax = _get_fig((10, 5))
+    ax.barh(labels, top.to_numpy())
     ax.set_xlabel("Number of Trips")
     ax.set_ylabel("Station")
     ax.set_title("Top 10 Start Stations by Trip Count")
@@ -40,10 +50,8 @@ def plot_trips_per_station(trips: pd.DataFrame, stations: pd.DataFrame) -> None:
 
 
 def plot_monthly_trend(trips: pd.DataFrame) -> None:
-    df = trips.copy()
-    df["year_month"] = df["start_time"].dt.to_period("M").dt.to_timestamp()
-    monthly = df.groupby("year_month")["trip_id"].count().sort_index()
-    fig, ax = plt.subplots(figsize=(10, 4))
+    monthly = trips.groupby(pd.Grouper(key="start_time", freq="MS"))["trip_id"].count()
+    fig, ax = _get_fig((10, 4))
     ax.plot(monthly.index, monthly.values, marker="o")
     ax.set_title("Monthly Trip Volume Trend")
     ax.set_xlabel("Month")
@@ -54,7 +62,7 @@ def plot_monthly_trend(trips: pd.DataFrame) -> None:
 
 def plot_duration_histogram(trips: pd.DataFrame) -> None:
     durations = trips["duration_minutes"].dropna()
-    fig, ax = plt.subplots(figsize=(8, 4))
+    fig, ax = _get_fig((8, 4))
     ax.hist(durations, bins=30)
     ax.set_title("Trip Duration Distribution")
     ax.set_xlabel("Duration (minutes)")
@@ -63,11 +71,20 @@ def plot_duration_histogram(trips: pd.DataFrame) -> None:
 
 
 def plot_duration_by_user_type(trips: pd.DataFrame) -> None:
-    df = trips[["user_type", "duration_minutes"]].dropna()
-    groups = [g["duration_minutes"].to_numpy() for _, g in df.groupby("user_type")]
-    labels = [name for name, _ in df.groupby("user_type")]
-    fig, ax = plt.subplots(figsize=(7, 4))
-    ax.boxplot(groups, labels=labels, showfliers=True)
+    grouped = (
+        trips[["user_type", "duration_minutes"]]
+        .dropna()
+        .groupby("user_type", sort=True, observed=True)["duration_minutes"]
+    )
+    labels: list[str] = []
+    groups = []
+    for name, durations in grouped:
+        labels.append(name)
+        groups.append(durations.to_numpy())
+    fig, ax = _get_fig((7, 4))
+    ax.boxplot(groups, showfliers=True)
+    # boxplot's labels= keyword was removed in Matplotlib 3.11; set the ticks directly
+    ax.set_xticks(range(1, len(labels) + 1), labels=labels)
     ax.set_title("Trip Duration by User Type")
     ax.set_xlabel("User type")
     ax.set_ylabel("Duration (minutes)")